@@ -1,13 +1,16 @@
+import array
 import logging
+import operator
 import sys
 import random
 import pygame
 import threading
+import time
 import easygui
 
 import numpy as np
 
-from typing import List, Tuple, Optional
+from typing import Callable, Tuple, Optional
 
 from pathlib import Path
 
@@ -16,18 +19,70 @@ from pathlib import Path
 UPPER_NIBBLE_MASK = 240
 LOWER_NIBBLE_MASK = 15
 BYTE_MASK = 255
+ADDRESS_MASK = 4095
 NUM_REPRESENTABLE_INTS_BYTE = 256
 OPCODE_SIZE = 2
 BYTE_SIZE = 8
 HEX_SIZE = 16
+RANDOM_BUFFER_SIZE = 4096
 
 # Opcodes
-RETURN_FROM_SUBROUTINE_OPCODE = bytes.fromhex("00ee")
-CLEAR_SCREEN_OPCODE = bytes.fromhex("00e0")
+RETURN_FROM_SUBROUTINE_OPCODE = int("00ee", HEX_SIZE)
+CLEAR_SCREEN_OPCODE = int("00e0", HEX_SIZE)
+
+# The Binary Coded Decimal digits for every possible byte value, ready to copy into memory
+BCD_TABLE = [bytes((value // 100, value // 10 % 10, value % 10)) for value in range(NUM_REPRESENTABLE_INTS_BYTE)]
+
+# Dispatch tables.  Handlers are stored by name and resolved with getattr so the lookup remains a single O(1) step per opcode.
+OPCODE_DISPATCH_TABLE = [
+    "route_system_opcode",
+    "opcode_goto",
+    "opcode_call_subroutine",
+    "opcode_if_equal",
+    "opcode_if_not_equal",
+    "route_register_equality_opcode",
+    "opcode_set_register_value",
+    "opcode_add_value",
+    "route_register_operation_opcode",
+    "route_register_inequality_opcode",
+    "opcode_set_register_i",
+    "opcode_goto_addition",
+    "opcode_random_bitwise_and",
+    "opcode_draw_sprite",
+    "route_key_state_opcode",
+    "route_special_opcode",
+]
+REGISTER_OPERATION_HANDLERS = {
+    0: "opcode_set_register_value_other_register",
+    1: "opcode_set_register_bitwise_or",
+    2: "opcode_set_register_bitwise_and",
+    3: "opcode_set_register_bitwise_xor",
+    4: "opcode_add_other_register",
+    5: "opcode_subtract_from_first_register",
+    6: "opcode_bit_shift_right",
+    7: "opcode_subtract_from_second_register",
+    14: "opcode_bit_shift_left",
+}
+KEY_STATE_HANDLERS = {
+    158: "opcode_if_key_pressed",
+    161: "opcode_if_key_not_pressed",
+}
+SPECIAL_HANDLERS = {
+    7: "opcode_get_delay_timer",
+    10: "opcode_wait_for_key_press",
+    21: "opcode_set_delay_timer",
+    24: "opcode_set_sound_timer",
+    30: "opcode_register_i_addition",
+    41: "opcode_set_register_i_to_hex_sprite_address",
+    51: "opcode_binary_coded_decimal",
+    85: "opcode_register_dump",
+    101: "opcode_register_load",
+}
 
 # Memory Addresses
 RAM_SIZE = 4096
 NUM_REGISTERS = 16
+STACK_SIZE = 16
 GAME_START_ADDRESS = 512
 INTERPRETER_END_ADDRESS = 80
 
@@ -35,21 +90,49 @@ INTERPRETER_END_ADDRESS = 80
 DEFAULT_WINDOW_NAME = "ChipPy"
 SCREEN_WIDTH = 64
 SCREEN_HEIGHT = 32
+SCREEN_WIDTH_MASK = SCREEN_WIDTH - 1  # The dimensions are powers of two, so wrapping can mask instead of dividing
+SCREEN_HEIGHT_MASK = SCREEN_HEIGHT - 1
 SCALED_SCREEN_WIDTH = 800
 SCALED_SCREEN_HEIGHT = 400
 SPRITE_WIDTH = 8
 HEX_CHAR_SPRITE_HEIGHT = 5
+DIGIT_SPRITES = bytes.fromhex(
+    "f0909090f0"  # 0
+    "2060202070"  # 1
+    "f010f080f0"  # 2
+    "f010f010f0"  # 3
+    "9090f01010"  # 4
+    "f080f010f0"  # 5
+    "f080f090f0"  # 6
+    "f010204040"  # 7
+    "f090f090f0"  # 8
+    "f090f010f0"  # 9
+    "f090f09090"  # a
+    "e090e090e0"  # b
+    "f0808080f0"  # c
+    "e0909090e0"  # d
+    "f080f080f0"  # e
+    "f080f08080"  # f
+)
 COLOUR_PALETTE = [(0, 0, 0), (0, 255, 0)] # Two colours, black and green
 
 # Timers
 TIMER_DELAY = 1 / 60
 OPCODE_DELAY = 1 / 500
+EVENT_LOOP_RATE = 240
 
 # Sound
 SOUND_FREQUENCY = 44100
 SOUND_BUFFER = 4096
 TONE_HZ = 550
 
+# Sound is weird; borrowing some of this chunk from here, I claim no credit for it: http://shallowsky.com/blog/programming/python-play-chords.html
+# One cycle of the tone is enough since the channel loops it; the amplitude is roughly half of the int16 range for a comfortable volume
+TONE_LENGTH = int(SOUND_FREQUENCY / TONE_HZ)
+TONE_AMPLITUDE = 16000
+TONE_OMEGA = np.pi * 2 / TONE_LENGTH
+SOUND_WAVE = np.ascontiguousarray((TONE_AMPLITUDE * np.sin(np.arange(TONE_LENGTH) * TONE_OMEGA)).astype(np.int16))
+
 # Games
 GAMES_PATH = str(Path(__file__).resolve().parent.parent.joinpath("games/.chip8"))
 
@@ -73,13 +156,24 @@ KEY_LOOKUP = {
     pygame.K_f: 14,
     pygame.K_v: 15,
 }
+
+# A flat lookup table over the low keycodes is faster than the dict on the event path; -1 marks unmapped keys
+KEY_LUT_SIZE = 512
+KEY_LUT = array.array("b", [KEY_LOOKUP.get(keyboard_key, -1) for keyboard_key in range(KEY_LUT_SIZE)])
 # endregion
 
 # region Top-level Setup
 # Set up the logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s]:  %(message)s", stream=sys.stdout)
-logger.disabled = "pydevd" not in sys.modules
+
+
+def configure_logging() -> None:
+    """
+    Configure the logging for running the emulator as an application.
+    """
+    logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s]:  %(message)s", stream=sys.stdout)
+    logger.disabled = "pydevd" not in sys.modules
+
 
 # Initialize the random number generator
 random.seed()
@@ -95,6 +189,8 @@ class WaitForKey:
     """
     A class which handles the blocking-for-key-press state.
     """
+    __slots__ = ("is_waiting", "storing_register")
+
     def __init__(self):
         """
         Constructor.
@@ -107,6 +203,8 @@ class Emulator:
     """
     The class which hold all the functionality of the emulator.
     """
+    __slots__ = ("ram", "registers", "register_i", "delay", "sound", "program_counter", "stack", "stack_pointer", "keys", "screen", "inter_screen", "pixels", "display_dirty", "waiting_for_key", "game_loaded", "selecting_game", "cpu_thread", "sound_player", "sound_channel", "random_buffer", "random_position")
+
     # region Lifecycle
     def __init__(self):
         """
@@ -119,30 +217,32 @@ class Emulator:
         self.delay = 0
         self.sound = 0
         self.program_counter = GAME_START_ADDRESS
-        self.stack: List[int] = []
-        self.keys: List[bool] = [False] * NUM_KEYS
+        self.stack = array.array("H", [0] * STACK_SIZE)
+        self.stack_pointer = 0
+        self.keys = bytearray(NUM_KEYS)
         self.screen: Optional[pygame.Surface] = None
         self.inter_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 8)
         self.pixels = np.zeros((SCREEN_WIDTH, SCREEN_HEIGHT), np.ubyte)
+        self.display_dirty = False
         self.waiting_for_key = WaitForKey()
         self.game_loaded = False
         self.selecting_game = False
 
-        # Declare the timers
-        self.opcode_timer: Optional[threading.Timer] = None
-        self.delay_timer: Optional[threading.Timer] = None
-        self.sound_timer: Optional[threading.Timer] = None
+        # Declare the thread which runs the fetch-execute cycle and ticks the timers
+        self.cpu_thread: Optional[threading.Thread] = None
+
+        # Set up the random byte buffer, refilled lazily by get_random_byte
+        self.random_buffer = b""
+        self.random_position = 0
 
         # Load the hexadecimal digit sprites into memory
         self.load_digit_sprites()
 
-        # Sound is weird; borrowing some of this chunk from here, I claim no credit for it: http://shallowsky.com/blog/programming/python-play-chords.html
-        length = SOUND_FREQUENCY / TONE_HZ
-        omega = np.pi * 2 / length
-        x_values = np.arange(int(length)) * omega
-        one_cycle = SOUND_BUFFER * np.sin(x_values)
-        sound_wave = np.resize(one_cycle, (SOUND_FREQUENCY,)).astype(np.int16)
-        self.sound_player = pygame.sndarray.make_sound(sound_wave)
+        # Set up the sound player from the precomputed wave, keeping the tone looping on a paused channel since pausing is much cheaper than stop/play cycles
+        self.sound_player = pygame.sndarray.make_sound(SOUND_WAVE)
+        self.sound_channel = pygame.mixer.Channel(0)
+        self.sound_channel.play(self.sound_player, loops=-1)
+        self.sound_channel.pause()
 
         # Set up the window
         pygame.display.set_caption(DEFAULT_WINDOW_NAME)
@@ -153,29 +253,33 @@ class Emulator:
         """
         Destructor.
         """
-        self.toggle_all_timers(False)
+        self.game_loaded = False
 
     def reset(self):
         """
         Reset the state of the emulator.
         """
-        # Re-initialize the necessary members
+        # Stop the CPU loop before touching any state it reads
         self.game_loaded = False
+        if self.cpu_thread and self.cpu_thread.is_alive():
+            self.cpu_thread.join()
+        self.cpu_thread = None
+
+        # Re-initialize the necessary members
         self.selecting_game = False
-        self.toggle_all_timers(False)
-        self.sound_player.stop()
+        self.sound_channel.pause()
         self.waiting_for_key.is_waiting = False
         self.register_i = 0
         self.delay = 0
         self.sound = 0
-        self.stack: List[int] = []
-        self.keys: List[bool] = [False] * NUM_KEYS
+        self.stack_pointer = 0
+        self.keys[:] = bytes(NUM_KEYS)
         self.program_counter = GAME_START_ADDRESS
         self.pixels.fill(0)
 
-        # Re-initialize memory
-        self.ram = bytearray(RAM_SIZE)
-        self.registers = bytearray(NUM_REGISTERS)
+        # Re-initialize memory in place so the buffers keep their identity for anything holding a view on them
+        self.ram[:] = bytes(RAM_SIZE)
+        self.registers[:] = bytes(NUM_REGISTERS)
         self.load_digit_sprites()
 
         # Re-initialize screen
@@ -221,25 +325,24 @@ class Emulator:
             return
 
         # Load the game into memory
-        logger.debug(f"Loading game at path {path}.")
+        logger.debug("Loading game at path %s.", path)
         with path.open("rb") as file:
             game = file.read()
-            for index, value in enumerate(game):
-                self.ram[GAME_START_ADDRESS + index] = value
+            self.ram[GAME_START_ADDRESS:GAME_START_ADDRESS + len(game)] = game
 
         # Set the window title to match the name of the game
         pygame.display.set_caption(path.stem)
 
-        # Mark the game as loaded and start the fetch-execute loop
+        # Mark the game as loaded and start the fetch-execute loop on its own thread
         self.game_loaded = True
-        self.fetch_and_run_opcode()
+        self.cpu_thread = threading.Thread(target=self.run_cpu_loop, daemon=True)
+        self.cpu_thread.start()
 
     def print_ram(self) -> None:
         """
         Dump the full memory of the emulator.
         """
-        for byte in self.ram:
-            print(hex(byte))
+        print("\n".join(hex(byte) for byte in self.ram))
     # endregion
 
     # region Graphics
@@ -247,22 +350,7 @@ class Emulator:
         """
         Load the sprites for the hexadecimal digits 0-f into memory.
         """
-        self.ram[0:5] = bytes.fromhex("f0909090f0")
-        self.ram[5:10] = bytes.fromhex("2060202070")
-        self.ram[10:15] = bytes.fromhex("f010f080f0")
-        self.ram[15:20] = bytes.fromhex("f010f010f0")
-        self.ram[20:25] = bytes.fromhex("9090f01010")
-        self.ram[25:30] = bytes.fromhex("f080f010f0")
-        self.ram[30:35] = bytes.fromhex("f080f090f0")
-        self.ram[35:40] = bytes.fromhex("f010204040")
-        self.ram[40:45] = bytes.fromhex("f090f090f0")
-        self.ram[45:50] = bytes.fromhex("f090f010f0")
-        self.ram[50:55] = bytes.fromhex("f090f09090")
-        self.ram[55:60] = bytes.fromhex("e090e090e0")
-        self.ram[60:65] = bytes.fromhex("f0808080f0")
-        self.ram[65:70] = bytes.fromhex("e0909090e0")
-        self.ram[70:75] = bytes.fromhex("f080f080f0")
-        self.ram[75:80] = bytes.fromhex("f080f08080")
+        self.ram[0:len(DIGIT_SPRITES)] = DIGIT_SPRITES
 
     def draw_to_display(self) -> None:
         """
@@ -282,7 +370,7 @@ class Emulator:
         Clear the screen.
         """
         self.pixels.fill(0)
-        self.draw_to_display()
+        self.display_dirty = True
     # endregion
 
     # region Flow
@@ -290,8 +378,18 @@ class Emulator:
         """
         Loop which handles all events.
         """
+        # Cap the poll rate so the loop waits between passes instead of spinning a full core
+        clock = pygame.time.Clock()
+
         running = True
         while running:
+            clock.tick(EVENT_LOOP_RATE)
+
+            # Present any pending display changes, coalescing draws which happened since the last pass
+            if self.display_dirty:
+                self.display_dirty = False
+                self.draw_to_display()
+
             # Go through each event
             for event in pygame.event.get():
                 # Mark the emulator as closing if the close button was clicked
@@ -314,10 +412,10 @@ class Emulator:
                         continue
 
                     # CHIP-8 Controls
-                    key = KEY_LOOKUP.get(event.key, None)
-                    if key is not None:
+                    key = KEY_LUT[event.key] if event.key < KEY_LUT_SIZE else -1
+                    if key >= 0:
                         self.keys[key] = pressed
-                        logger.debug(f"Key State Changed.  Key: {key}, Pressed: {pressed}.")
+                        logger.debug("Key State Changed.  Key: %s, Pressed: %s.", key, pressed)
 
                         # Handle the blocking-for-keypress opcode
                         if self.waiting_for_key.is_waiting and pressed:
@@ -336,120 +434,62 @@ class Emulator:
         self.waiting_for_key.is_waiting = False
         self.registers[self.waiting_for_key.storing_register] = key
 
-        # Restart execution
-        self.toggle_all_timers(True)
-        logger.debug(f"Storing the key {key} in the register {self.waiting_for_key.storing_register}, completing the blocking opcode and un-blocking all execution.")
+        logger.debug("Storing the key %s in the register %s, completing the blocking opcode and un-blocking all execution.", key, self.waiting_for_key.storing_register)
     # endregion
 
     # region Timers
-    def decrement_delay_timer(self) -> None:
-        """
-        Decrement the value of the delay timer, restarting it if the value is still above 0.
-        """
-        # Stop the timer
-        self.toggle_delay_timer(False)
-
-        # Decrement
-        self.delay -= 1
-        logger.debug(f"Delay timer decremented, new value is {self.delay}.")
-
-        # If the timer has reached or passed 0, we're done, just clamp it
-        if self.delay <= 0:
-            self.delay = 0
-        else:
-            # Restart the timer since it hasn't hit 0 yet
-            self.toggle_delay_timer(True)
-            logger.debug(f"Starting delay timer.")
-
-    def decrement_sound_timer(self) -> None:
+    def run_cpu_loop(self) -> None:
         """
-        Decrement the value of the sound timer, restarting it if the value is still above 0, stopping the sound otherwise.
+        Run the fetch-execute cycle and tick the timers on a monotonic schedule until the game is unloaded.
         """
-        # Stop the timer
-        self.toggle_sound_timer(False)
+        # Anchor the deadlines to the monotonic clock
+        opcode_deadline = time.perf_counter()
+        timer_deadline = opcode_deadline
 
-        # Decrement
-        self.sound -= 1
-        logger.debug(f"Sound timer decremented, new value is {self.sound}.")
+        while self.game_loaded:
+            now = time.perf_counter()
 
-        # If the timer has reached or passed 0, we're done, clamp it and stop playing any sound
-        if self.sound <= 0:
-            self.sound = 0
-            self.sound_player.stop()
-            logger.debug(f"Stopping sound.")
-        else:
-            # Restart the timer since it hasn't hit 0 yet
-            self.toggle_sound_timer(True)
-            logger.debug(f"Starting sound timer.")
+            # Tick the delay and sound timers at their own cadence
+            if now >= timer_deadline:
+                self.tick_timers()
+                timer_deadline += TIMER_DELAY
 
-    def toggle_all_timers(self, status: bool) -> None:
-        """
-        Start / stop all timers.
-        :param status: True if the timers should be started, False otherwise.
-        """
-        self.toggle_opcode_timer(status)
-        self.toggle_delay_timer(status)
-        self.toggle_sound_timer(status)
-
-    def toggle_opcode_timer(self, status: bool) -> None:
-        """
-        Start / stop the opcode timer.
-        :param status: True if the timer should be started, False otherwise.
-        """
-        # Kill the current timer if it exists
-        if self.opcode_timer:
-            self.opcode_timer.cancel()
-
-        # Start the timer if requested
-        if status:
-            # Create a new timer
-            self.opcode_timer = threading.Timer(OPCODE_DELAY, self.fetch_and_run_opcode)
-
-            # Make sure it is killed if the parent process ends
-            self.opcode_timer.daemon = True
-
-            # Actually start the timer
-            self.opcode_timer.start()
-
-    def toggle_delay_timer(self, status: bool) -> None:
-        """
-        Start / stop the delay timer.
-        :param status: True if the timer should be started, false otherwise.
-        """
-        # Kill the current timer if it exists
-        if self.delay_timer:
-            self.delay_timer.cancel()
+                # If we fell too far behind to catch up, re-anchor instead of bursting
+                if timer_deadline <= now:
+                    timer_deadline = now + TIMER_DELAY
 
-        # Start the timer if requested
-        if status:
-            # Create a new timer
-            self.delay_timer = threading.Timer(TIMER_DELAY, self.decrement_delay_timer)
+            # Run the next instruction unless blocked waiting for a keypress
+            if self.waiting_for_key.is_waiting:
+                opcode_deadline = now + OPCODE_DELAY
+            else:
+                self.fetch_and_run_opcode()
+                opcode_deadline += OPCODE_DELAY
 
-            # Make sure it is killed if the parent process ends
-            self.delay_timer.daemon = True
+                # If we fell too far behind to catch up, re-anchor instead of bursting
+                if opcode_deadline <= now:
+                    opcode_deadline = now + OPCODE_DELAY
 
-            # Actually start the timer
-            self.delay_timer.start()
+            # Sleep off the slack until the next piece of work is due
+            slack = min(opcode_deadline, timer_deadline) - time.perf_counter()
+            if slack > 0:
+                time.sleep(slack)
 
-    def toggle_sound_timer(self, status: bool) -> None:
+    def tick_timers(self) -> None:
         """
-        Start / stop the sound timer.
-        :param status: True if the timer should be started, false otherwise.
+        Decrement the delay and sound timers if they are running, stopping the sound when its timer expires.
         """
-        # Kill the current timer if it exists
-        if self.sound_timer:
-            self.sound_timer.cancel()
-
-        # Start the timer if requested
-        if status:
-            # Create a new timer
-            self.sound_timer = threading.Timer(TIMER_DELAY, self.decrement_sound_timer)
-
-            # Make sure it is killed if the parent process ends
-            self.sound_timer.daemon = True
+        # Decrement the delay timer
+        if self.delay > 0:
+            self.delay -= 1
+            logger.debug("Delay timer decremented, new value is %s.", self.delay)
 
-            # Actually start the timer
-            self.sound_timer.start()
+        # Decrement the sound timer, stopping the sound once it expires
+        if self.sound > 0:
+            self.sound -= 1
+            logger.debug("Sound timer decremented, new value is %s.", self.sound)
+            if self.sound == 0:
+                self.sound_channel.pause()
+                logger.debug("Stopping sound.")
     # endregion
 
     # region Helpers
@@ -471,6 +511,21 @@ class Emulator:
         """
         return byte & LOWER_NIBBLE_MASK
 
+    def get_random_byte(self) -> int:
+        """
+        Get a random byte, refilling the buffer of random bytes if it has been exhausted.
+        :return: A random integer [0, 255].
+        """
+        # Refill the buffer if it has been used up
+        if self.random_position >= len(self.random_buffer):
+            self.random_buffer = random.randbytes(RANDOM_BUFFER_SIZE)
+            self.random_position = 0
+
+        # Consume the next byte
+        random_value = self.random_buffer[self.random_position]
+        self.random_position += 1
+        return random_value
+
     @staticmethod
     def bounded_subtract(minuend: int, subtrahend: int) -> Tuple[int, int]:
         """
@@ -480,8 +535,8 @@ class Emulator:
         :return: The result of the subtraction and the not borrow (1 if there was no borrow, 0 otherwise).
         """
         difference_of_registers = minuend - subtrahend
-        result = difference_of_registers % NUM_REPRESENTABLE_INTS_BYTE
-        not_borrow = 1 if difference_of_registers >= 0 else 0
+        result = difference_of_registers & BYTE_MASK
+        not_borrow = int(difference_of_registers >= 0)
         return result, not_borrow
     # endregion
 
@@ -490,15 +545,11 @@ class Emulator:
         """
         Fetches the current instruction and executes it.
         """
-        # Determine and run the current instruction
-        opcode = self.ram[self.program_counter:self.program_counter + OPCODE_SIZE]
+        # Determine and run the current instruction, packing the two instruction bytes into a single integer
+        opcode = (self.ram[self.program_counter] << BYTE_SIZE) + self.ram[self.program_counter + 1]
         self.run_opcode(opcode)
 
-        # If we are not blocked, delay for the next instruction
-        if not self.waiting_for_key.is_waiting:
-            self.toggle_opcode_timer(True)
-
-    def run_opcode(self, opcode: bytes) -> None:
+    def run_opcode(self, opcode: int) -> None:
         """
         Route the provided opcode to the correct method to execute it.  Increment the program counter to the next instruction.
         :param opcode: The opcode to execute.
@@ -506,180 +557,186 @@ class Emulator:
         # Increment the program counter
         self.program_counter += OPCODE_SIZE
 
-        # Get some common parts which determine the opcode
-        first_nibble = self.get_upper_nibble(opcode[0])
-        last_nibble = self.get_lower_nibble(opcode[1])
+        # Route to the correct method via the dispatch table, keyed on the first nibble of the opcode
+        getattr(self, OPCODE_DISPATCH_TABLE[opcode >> 12])(opcode)
 
-        # Route to the correct method depending on the opcode
+    def report_invalid_opcode(self, opcode: int) -> None:
+        """
+        Log an error for an opcode with no matching handler.
+        :param opcode: The opcode which could not be routed.
+        """
+        logger.error("Unimplemented / Invalid Opcode: %04x.", opcode)
+
+    def route_system_opcode(self, opcode: int) -> None:
+        """
+        Route the system opcodes (first nibble 0) to the correct method.
+        :param opcode: The opcode to execute.
+        """
         if opcode == CLEAR_SCREEN_OPCODE:
             self.opcode_clear_screen(opcode)
         elif opcode == RETURN_FROM_SUBROUTINE_OPCODE:
             self.opcode_return_from_subroutine(opcode)
-        elif first_nibble == 0:
-            self.opcode_call_subroutine(opcode)
-        elif first_nibble == 1:
-            self.opcode_goto(opcode)
-        elif first_nibble == 2:
+        else:
             self.opcode_call_subroutine(opcode)
-        elif first_nibble == 3:
-            self.opcode_if_equal(opcode)
-        elif first_nibble == 4:
-            self.opcode_if_not_equal(opcode)
-        elif first_nibble == 5 and last_nibble == 0:
+
+    def route_register_equality_opcode(self, opcode: int) -> None:
+        """
+        Route the register equality opcode (first nibble 5), which is only valid with a last nibble of 0.
+        :param opcode: The opcode to execute.
+        """
+        if opcode & LOWER_NIBBLE_MASK == 0:
             self.opcode_if_register_equal(opcode)
-        elif first_nibble == 6:
-            self.opcode_set_register_value(opcode)
-        elif first_nibble == 7:
-            self.opcode_add_value(opcode)
-        elif first_nibble == 8 and last_nibble == 0:
-            self.opcode_set_register_value_other_register(opcode)
-        elif first_nibble == 8 and last_nibble == 1:
-            self.opcode_set_register_bitwise_or(opcode)
-        elif first_nibble == 8 and last_nibble == 2:
-            self.opcode_set_register_bitwise_and(opcode)
-        elif first_nibble == 8 and last_nibble == 3:
-            self.opcode_set_register_bitwise_xor(opcode)
-        elif first_nibble == 8 and last_nibble == 4:
-            self.opcode_add_other_register(opcode)
-        elif first_nibble == 8 and last_nibble == 5:
-            self.opcode_subtract_from_first_register(opcode)
-        elif first_nibble == 8 and last_nibble == 6:
-            self.opcode_bit_shift_right(opcode)
-        elif first_nibble == 8 and last_nibble == 7:
-            self.opcode_subtract_from_second_register(opcode)
-        elif first_nibble == 8 and last_nibble == 14:
-            self.opcode_bit_shift_left(opcode)
-        elif first_nibble == 9 and last_nibble == 0:
+        else:
+            self.report_invalid_opcode(opcode)
+
+    def route_register_operation_opcode(self, opcode: int) -> None:
+        """
+        Route the register operation opcodes (first nibble 8) to the correct method based on the last nibble.
+        :param opcode: The opcode to execute.
+        """
+        handler_name = REGISTER_OPERATION_HANDLERS.get(opcode & LOWER_NIBBLE_MASK)
+        if handler_name is None:
+            self.report_invalid_opcode(opcode)
+            return
+
+        getattr(self, handler_name)(opcode)
+
+    def route_register_inequality_opcode(self, opcode: int) -> None:
+        """
+        Route the register inequality opcode (first nibble 9), which is only valid with a last nibble of 0.
+        :param opcode: The opcode to execute.
+        """
+        if opcode & LOWER_NIBBLE_MASK == 0:
             self.opcode_if_register_not_equal(opcode)
-        elif first_nibble == 10:
-            self.opcode_set_register_i(opcode)
-        elif first_nibble == 11:
-            self.opcode_goto_addition(opcode)
-        elif first_nibble == 12:
-            self.opcode_random_bitwise_and(opcode)
-        elif first_nibble == 13:
-            self.opcode_draw_sprite(opcode)
-        elif first_nibble == 14 and opcode[1] == 158:
-            self.opcode_if_key_pressed(opcode)
-        elif first_nibble == 14 and opcode[1] == 161:
-            self.opcode_if_key_not_pressed(opcode)
-        elif first_nibble == 15 and opcode[1] == 7:
-            self.opcode_get_delay_timer(opcode)
-        elif first_nibble == 15 and opcode[1] == 10:
-            self.opcode_wait_for_key_press(opcode)
-        elif first_nibble == 15 and opcode[1] == 21:
-            self.opcode_set_delay_timer(opcode)
-        elif first_nibble == 15 and opcode[1] == 24:
-            self.opcode_set_sound_timer(opcode)
-        elif first_nibble == 15 and opcode[1] == 30:
-            self.opcode_register_i_addition(opcode)
-        elif first_nibble == 15 and opcode[1] == 41:
-            self.opcode_set_register_i_to_hex_sprite_address(opcode)
-        elif first_nibble == 15 and opcode[1] == 51:
-            self.opcode_binary_coded_decimal(opcode)
-        elif first_nibble == 15 and opcode[1] == 85:
-            self.opcode_register_dump(opcode)
-        elif first_nibble == 15 and opcode[1] == 101:
-            self.opcode_register_load(opcode)
         else:
-            # If no match is found, just log an error
-            logger.error(f"Unimplemented / Invalid Opcode: {opcode.hex()}.")
+            self.report_invalid_opcode(opcode)
+
+    def route_key_state_opcode(self, opcode: int) -> None:
+        """
+        Route the key state opcodes (first nibble 14) to the correct method based on the second byte.
+        :param opcode: The opcode to execute.
+        """
+        handler_name = KEY_STATE_HANDLERS.get(opcode & BYTE_MASK)
+        if handler_name is None:
+            self.report_invalid_opcode(opcode)
+            return
 
-    def opcode_clear_screen(self, opcode: bytes) -> None:
+        getattr(self, handler_name)(opcode)
+
+    def route_special_opcode(self, opcode: int) -> None:
+        """
+        Route the timer, key, and memory opcodes (first nibble 15) to the correct method based on the second byte.
+        :param opcode: The opcode to execute.
+        """
+        handler_name = SPECIAL_HANDLERS.get(opcode & BYTE_MASK)
+        if handler_name is None:
+            self.report_invalid_opcode(opcode)
+            return
+
+        getattr(self, handler_name)(opcode)
+
+    def opcode_clear_screen(self, opcode: int) -> None:
         """
         Clear the screen.
         :param opcode: The opcode to execute.
         """
         self.clear_screen()
-        logger.debug(f"Execute Opcode {opcode.hex()}: Clearing the screen.")
+        logger.debug("Execute Opcode %04x: Clearing the screen.", opcode)
 
-    def opcode_return_from_subroutine(self, opcode: bytes) -> None:
+    def opcode_return_from_subroutine(self, opcode: int) -> None:
         """
         Return from the current subroutine.
         :param opcode: The opcode to execute.
         """
         # Catching a mistake which should be on the ROM writer to notice, but prevent returning froma subroutine when we aren't in one
-        if len(self.stack) == 0:
+        if self.stack_pointer == 0:
             logger.error("Tried to return from a subroutine when not in one.  Ignoring.")
             return
 
         # Set the program counter to where we were prior to the start of the subroutine
-        self.program_counter = self.stack.pop()
-        logger.debug(f"Execute Opcode {opcode.hex()}: Return from subroutine, continue at {hex(self.program_counter)}.")
+        self.stack_pointer -= 1
+        self.program_counter = self.stack[self.stack_pointer]
+        logger.debug("Execute Opcode %04x: Return from subroutine, continue at %s.", opcode, hex(self.program_counter))
 
-    def opcode_goto(self, opcode: bytes) -> None:
+    def opcode_goto(self, opcode: int) -> None:
         """
         Jump to the provided address.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        address = (self.get_lower_nibble(opcode[0]) << BYTE_SIZE) + opcode[1]
+        address = opcode & ADDRESS_MASK
 
         # Perform the instruction
         self.program_counter = address
-        logger.debug(f"Execute Opcode {opcode.hex()}: Jump to address {hex(address)}.")
+        logger.debug("Execute Opcode %04x: Jump to address %s.", opcode, hex(address))
 
-    def opcode_call_subroutine(self, opcode: bytes) -> None:
+    def opcode_call_subroutine(self, opcode: int) -> None:
         """
         Call the subroutine at the given address.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        address = (self.get_lower_nibble(opcode[0]) << BYTE_SIZE) + opcode[1]
+        address = opcode & ADDRESS_MASK
+
+        # Catching a mistake which should be on the ROM writer to notice, but prevent overflowing the fixed-size stack
+        if self.stack_pointer == STACK_SIZE:
+            logger.error("Tried to call a subroutine with the stack already full.  Ignoring.")
+            return
 
         # Perform the instruction
-        self.stack.append(self.program_counter)
+        self.stack[self.stack_pointer] = self.program_counter
+        self.stack_pointer += 1
         self.program_counter = address
-        logger.debug(f"Execute Opcode {opcode.hex()}: Call subroutine at address {hex(address)}.")
+        logger.debug("Execute Opcode %04x: Call subroutine at address %s.", opcode, hex(address))
 
-    def opcode_if_equal(self, opcode: bytes) -> None:
+    def opcode_if_equal(self, opcode: int) -> None:
         """
         Skip the next instruction if the value of the provided register is equal to the provided value.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if register {register}'s value ({register_value}) is {opcode[1]}.")
+        logger.debug("Execute Opcode %04x: Skip next instruction if register %s's value (%s) is %s.", opcode, register, register_value, opcode & BYTE_MASK)
 
         # Skip the next instruction if the value is equal
-        if register_value == opcode[1]:
+        if register_value == opcode & BYTE_MASK:
             self.program_counter += OPCODE_SIZE
             logger.debug("Instruction skipped.")
         else:
             logger.debug("Instruction not skipped.")
 
-    def opcode_if_not_equal(self, opcode: bytes) -> None:
+    def opcode_if_not_equal(self, opcode: int) -> None:
         """
         Skip the next instruction if the value of the provided register is not equal to the provided value.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if register {register}'s value ({register_value}) is not {opcode[1]}.")
+        logger.debug("Execute Opcode %04x: Skip next instruction if register %s's value (%s) is not %s.", opcode, register, register_value, opcode & BYTE_MASK)
 
         # Skip the next instruction if the value is not equal
-        if register_value != opcode[1]:
+        if register_value != opcode & BYTE_MASK:
             self.program_counter += OPCODE_SIZE
             logger.debug("Instruction skipped.")
         else:
             logger.debug("Instruction not skipped.")
 
-    def opcode_if_register_equal(self, opcode: bytes) -> None:
+    def opcode_if_register_equal(self, opcode: int) -> None:
         """
         Skip the next instruction if the value of the first provided register is equal to the value of the second provided register.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
         first_register_value = self.registers[first_register]
         second_register_value = self.registers[second_register]
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if register {first_register}'s value ({first_register_value}) is equal to register {second_register}'s value ({second_register_value}).")
+        logger.debug("Execute Opcode %04x: Skip next instruction if register %s's value (%s) is equal to register %s's value (%s).", opcode, first_register, first_register_value, second_register, second_register_value)
 
         # Skip the next instruction if the values are equal
         if first_register_value == second_register_value:
@@ -688,189 +745,198 @@ class Emulator:
         else:
             logger.debug("Instruction not skipped.")
 
-    def opcode_set_register_value(self, opcode: bytes) -> None:
+    def opcode_set_register_value(self, opcode: int) -> None:
         """
         Set the value of the provided register to the provided value.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
 
         # Perform the instruction
-        self.registers[register] = opcode[1]
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {register} to {opcode[1]}.")
+        self.registers[register] = opcode & BYTE_MASK
+        logger.debug("Execute Opcode %04x: Set the value of register %s to %s.", opcode, register, opcode & BYTE_MASK)
 
-    def opcode_add_value(self, opcode: bytes) -> None:
+    def opcode_add_value(self, opcode: int) -> None:
         """
         Adds the provided value to the value of the provided register.  The carry flag (register 15) is not set.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
 
         # Perform the instruction
-        self.registers[register] = (self.registers[register] + opcode[1]) % NUM_REPRESENTABLE_INTS_BYTE
-        logger.debug(f"Execute Opcode {opcode.hex()}: Add {opcode[1]} to the value of register {register}.")
+        self.registers[register] = (self.registers[register] + opcode) & BYTE_MASK
+        logger.debug("Execute Opcode %04x: Add %s to the value of register %s.", opcode, opcode & BYTE_MASK, register)
 
-    def opcode_set_register_value_other_register(self, opcode: bytes) -> None:
+    def opcode_set_register_value_other_register(self, opcode: int) -> None:
         """
         Set the value of the first provided register to the value of the second provided register.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
         second_register_value = self.registers[second_register]
 
         # Perform the instruction
         self.registers[first_register] = second_register_value
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the value of register {second_register}'s value ({second_register_value}).")
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the value of register %s's value (%s).", opcode, first_register, second_register, second_register_value)
 
-    def opcode_set_register_bitwise_or(self, opcode: bytes) -> None:
+    def apply_register_bitwise_operation(self, opcode: int, operation: Callable[[int, int], int], operation_name: str) -> None:
         """
-        Sets the value of the first provided register to the bitwise or of itself and the value of the second provided register.
+        Sets the value of the first provided register to the result of the provided bitwise operation between itself and the value of the second provided register.
         :param opcode: The opcode to execute.
+        :param operation: The bitwise operation to apply to the two register values.
+        :param operation_name: The symbol for the operation to use in logging.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
-        result = first_register_value | second_register_value
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
+        second_register_value = registers[second_register]
+        result = operation(first_register_value, second_register_value)
 
         # Perform the instruction
-        self.registers[first_register] = result
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the bitwise or of itself and the value of register {second_register} ({first_register_value} | {second_register_value} = {result}).")
+        registers[first_register] = result
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the bitwise %s of itself and the value of register %s (%s %s %s = %s).", opcode, first_register, operation_name, second_register, first_register_value, operation_name, second_register_value, result)
 
-    def opcode_set_register_bitwise_and(self, opcode: bytes) -> None:
+    def opcode_set_register_bitwise_or(self, opcode: int) -> None:
         """
-        Sets the value of the first provided register to the bitwise and of itself and the value of the second provided register.
+        Sets the value of the first provided register to the bitwise or of itself and the value of the second provided register.
         :param opcode: The opcode to execute.
         """
-        # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
-        result = first_register_value & second_register_value
+        self.apply_register_bitwise_operation(opcode, operator.or_, "|")
 
-        # Perform the instruction
-        self.registers[first_register] = result
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the bitwise and of itself and the value of register {second_register} ({first_register_value} & {second_register_value} = {result}).")
+    def opcode_set_register_bitwise_and(self, opcode: int) -> None:
+        """
+        Sets the value of the first provided register to the bitwise and of itself and the value of the second provided register.
+        :param opcode: The opcode to execute.
+        """
+        self.apply_register_bitwise_operation(opcode, operator.and_, "&")
 
-    def opcode_set_register_bitwise_xor(self, opcode: bytes) -> None:
+    def opcode_set_register_bitwise_xor(self, opcode: int) -> None:
         """
         Sets the value of the first provided register to the bitwise xor of itself and the value of the second provided register.
         :param opcode: The opcode to execute.
         """
-        # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
-        result = first_register_value ^ second_register_value
-
-        # Perform the instruction
-        self.registers[first_register] = result
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the bitwise xor of itself and the value of register {second_register} ({first_register_value} ^ {second_register_value} = {result}).")
+        self.apply_register_bitwise_operation(opcode, operator.xor, "^")
 
-    def opcode_add_other_register(self, opcode: bytes) -> None:
+    def opcode_add_other_register(self, opcode: int) -> None:
         """
         Sets the value of the first provided register to the sum of itself and the value of the second provided register.  The carry flag (register 15) is set.
         :param opcode: The opcode to execute.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
+        second_register_value = registers[second_register]
         sum_of_registers = first_register_value + second_register_value
-        result = sum_of_registers % NUM_REPRESENTABLE_INTS_BYTE
-        carry = 1 if sum_of_registers >= NUM_REPRESENTABLE_INTS_BYTE else 0
+        result = sum_of_registers & BYTE_MASK
+        carry = sum_of_registers >> BYTE_SIZE
 
         # Perform the instruction
-        self.registers[first_register] = result
-        self.registers[15] = carry
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the sum of itself and the value of register {second_register} ({first_register_value} + {second_register_value} = {result}, carry = {carry}).")
+        registers[first_register] = result
+        registers[15] = carry
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the sum of itself and the value of register %s (%s + %s = %s, carry = %s).", opcode, first_register, second_register, first_register_value, second_register_value, result, carry)
 
-    def opcode_subtract_from_first_register(self, opcode: bytes) -> None:
+    def opcode_subtract_from_first_register(self, opcode: int) -> None:
         """
         Sets the value of the first provided register to the difference of itself and the value of the second provided register.  The not borrow flag (register 15) is set.
         :param opcode: The opcode to execute.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
+        second_register_value = registers[second_register]
         result, not_borrow = self.bounded_subtract(first_register_value, second_register_value)
 
         # Perform the instruction
-        self.registers[first_register] = result
-        self.registers[15] = not_borrow
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the difference of itself and the value of register {second_register} ({first_register_value} - {second_register_value} = {result}, not borrow = {not_borrow}).")
+        registers[first_register] = result
+        registers[15] = not_borrow
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the difference of itself and the value of register %s (%s - %s = %s, not borrow = %s).", opcode, first_register, second_register, first_register_value, second_register_value, result, not_borrow)
 
-    def opcode_bit_shift_right(self, opcode: bytes) -> None:
+    def opcode_bit_shift_right(self, opcode: int) -> None:
         """
         Shift the value of the first provided register to the right by 1.  Set register 15 to the value of the least significant bit before the operation.
         :param opcode: The opcode to execute.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        first_register_value = self.registers[first_register]
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
         bit_shift = first_register_value >> 1
         least_significant_bit = first_register_value & 1
 
         # Perform the instruction
-        self.registers[first_register] = bit_shift
-        self.registers[15] = least_significant_bit
-        logger.debug(f"Execute Opcode {opcode.hex()}: Shift the value of register {first_register} to the right by 1 ({first_register_value} >> 1 = {bit_shift}, previous least significant bit = {least_significant_bit}).")
+        registers[first_register] = bit_shift
+        registers[15] = least_significant_bit
+        logger.debug("Execute Opcode %04x: Shift the value of register %s to the right by 1 (%s >> 1 = %s, previous least significant bit = %s).", opcode, first_register, first_register_value, bit_shift, least_significant_bit)
 
-    def opcode_subtract_from_second_register(self, opcode: bytes) -> None:
+    def opcode_subtract_from_second_register(self, opcode: int) -> None:
         """
         Sets the value of the first provided register to the difference of the value of the second provided register and itself.  The not borrow flag (register 15) is set.
         :param opcode: The opcode to execute.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
-        first_register_value = self.registers[first_register]
-        second_register_value = self.registers[second_register]
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
+        second_register_value = registers[second_register]
         result, not_borrow = self.bounded_subtract(second_register_value, first_register_value)
 
         # Perform the instruction
-        self.registers[first_register] = result
-        self.registers[15] = not_borrow
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {first_register} to the difference of the value of register {second_register} and itself ({second_register_value} - {first_register_value} = {result}, not borrow = {not_borrow}).")
+        registers[first_register] = result
+        registers[15] = not_borrow
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the difference of the value of register %s and itself (%s - %s = %s, not borrow = %s).", opcode, first_register, second_register, second_register_value, first_register_value, result, not_borrow)
 
-    def opcode_bit_shift_left(self, opcode: bytes) -> None:
+    def opcode_bit_shift_left(self, opcode: int) -> None:
         """
         Shift the value of the first provided register to the left by 1.  Set register 15 to the value of the most significant bit before the operation.
         :param opcode: The opcode to execute.
         """
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
+
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        first_register_value = self.registers[first_register]
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        first_register_value = registers[first_register]
         bit_shift = (first_register_value << 1) & BYTE_MASK
-        most_significant_bit = 1 if first_register_value & 128 == 128 else 0
+        most_significant_bit = first_register_value >> 7
 
         # Perform the instruction
-        self.registers[first_register] = bit_shift
-        self.registers[15] = most_significant_bit
-        logger.debug(f"Execute Opcode {opcode.hex()}: Shift the value of register {first_register} to the left by 1 ({first_register_value} << 1 = {bit_shift}, previous most significant bit = {most_significant_bit}).")
+        registers[first_register] = bit_shift
+        registers[15] = most_significant_bit
+        logger.debug("Execute Opcode %04x: Shift the value of register %s to the left by 1 (%s << 1 = %s, previous most significant bit = %s).", opcode, first_register, first_register_value, bit_shift, most_significant_bit)
 
-    def opcode_if_register_not_equal(self, opcode: bytes) -> None:
+    def opcode_if_register_not_equal(self, opcode: int) -> None:
         """
         Skip the next instruction if the value of the first provided register is not equal to the value of the second provided register.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        first_register = self.get_lower_nibble(opcode[0])
-        second_register = self.get_upper_nibble(opcode[1])
+        first_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        second_register = (opcode >> 4) & LOWER_NIBBLE_MASK
         first_register_value = self.registers[first_register]
         second_register_value = self.registers[second_register]
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if register {first_register}'s value ({first_register_value}) is not equal to register {second_register}'s value ({second_register_value}).")
+        logger.debug("Execute Opcode %04x: Skip next instruction if register %s's value (%s) is not equal to register %s's value (%s).", opcode, first_register, first_register_value, second_register, second_register_value)
 
         # Skip the next instruction if the values are not equal
         if first_register_value != second_register_value:
@@ -879,229 +945,196 @@ class Emulator:
         else:
             logger.debug("Instruction not skipped.")
 
-    def opcode_set_register_i(self, opcode: bytes) -> None:
+    def opcode_set_register_i(self, opcode: int) -> None:
         """
         Sets the value of register I to the provided value.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        address = (self.get_lower_nibble(opcode[0]) << BYTE_SIZE) + opcode[1]
+        address = opcode & ADDRESS_MASK
 
         # Perform the instruction
         self.register_i = address
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set register I to {hex(address)}.")
+        logger.debug("Execute Opcode %04x: Set register I to %s.", opcode, hex(address))
 
-    def opcode_goto_addition(self, opcode: bytes) -> None:
+    def opcode_goto_addition(self, opcode: int) -> None:
         """
         Jump to the provided address plus the value of register 0.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        address = (self.get_lower_nibble(opcode[0]) << BYTE_SIZE) + opcode[1]
+        address = opcode & ADDRESS_MASK
         register_value = self.registers[0]
 
         # Perform the instruction
         self.program_counter = address + register_value
-        logger.debug(f"Execute Opcode {opcode.hex()}: Jump to the provided address plus the value of register 0 ({hex(address)} + {hex(register_value)} = {hex(self.program_counter)}).")
+        logger.debug("Execute Opcode %04x: Jump to the provided address plus the value of register 0 (%s + %s = %s).", opcode, hex(address), hex(register_value), hex(self.program_counter))
 
-    def opcode_random_bitwise_and(self, opcode: bytes) -> None:
+    def opcode_random_bitwise_and(self, opcode: int) -> None:
         """
         Set the value of the provided register to the bitwise and of the provided value and a random number [0, 255].
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
-        random_value = random.randint(0, NUM_REPRESENTABLE_INTS_BYTE - 1)
-        result = opcode[1] & random_value
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        random_value = self.get_random_byte()
+        result = opcode & BYTE_MASK & random_value
 
         # Perform the instruction
         self.registers[register] = result
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {register} to the bitwise and of the provided value and a random number [0, 255] ({opcode[1]} & {random_value} = {result}).")
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the bitwise and of the provided value and a random number [0, 255] (%s & %s = %s).", opcode, register, opcode & BYTE_MASK, random_value, result)
 
-    def opcode_draw_sprite(self, opcode: bytes) -> None:
+    def opcode_draw_sprite(self, opcode: int) -> None:
         """
         Draws the sprite with the provided height found at the address denoted by the value of register I to the provided x and y coordinates.  The collision flag (register 15) is set to 1 if a pixel was unset, 0 otherwise.
         :param opcode: The opcode to execute.
         """
-        # Get the necessary information from the opcode
-        register_x = self.get_lower_nibble(opcode[0])
-        register_y = self.get_upper_nibble(opcode[1])
-        register_x_value = self.registers[register_x]
-        register_y_value = self.registers[register_y]
-        height = self.get_lower_nibble(opcode[1])
-
-        # Start with the pixel unset flag set to off
-        pixel_unset = 0
-
-        # For each row in the height of the sprite
-        for row in range(height):
-            # Get the byte for the giuven row
-            byte = self.ram[self.register_i + row]
+        # Hoist the register file into a local to avoid repeated attribute lookups
+        registers = self.registers
 
-            # Get the y-coordinate, wrapping the screen if necessary
-            y_coordinate = (register_y_value + row) % SCREEN_HEIGHT
-
-            # For each pixel in the row
-            for column in range(SPRITE_WIDTH):
-                # Get the x-coordinate, wrapping the screen if necessary
-                x_coordinate = (register_x_value + column) % SCREEN_WIDTH
+        # Get the necessary information from the opcode
+        register_x = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        register_y = (opcode >> 4) & LOWER_NIBBLE_MASK
+        register_x_value = registers[register_x]
+        register_y_value = registers[register_y]
+        height = opcode & LOWER_NIBBLE_MASK
 
-                # Get the particular pixel in the sprite
-                pixel = ((byte >> (SPRITE_WIDTH - 1 - column)) & 1)
+        # Unpack the sprite bytes into a grid of pixels, one row per byte
+        sprite = np.unpackbits(np.frombuffer(self.ram, np.uint8, height, self.register_i)).reshape(height, SPRITE_WIDTH).T
 
-                # Set the flag if a pixel which was previously on would be turned off, signifying a collision
-                if pixel_unset == 0 and self.pixels[x_coordinate, y_coordinate] == 1 and pixel == 1:
-                    pixel_unset = 1
+        # Get the coordinates covered by the sprite, wrapping the screen if necessary
+        x_coordinates = (register_x_value + np.arange(SPRITE_WIDTH)) & SCREEN_WIDTH_MASK
+        y_coordinates = (register_y_value + np.arange(height)) & SCREEN_HEIGHT_MASK
+        region = np.ix_(x_coordinates, y_coordinates)
 
-                # Set the pixel, XOR to turn off in the case of a collision
-                self.pixels[x_coordinate, y_coordinate] ^= pixel
+        # Set the pixel unset flag register if any pixel which was previously on would be turned off, signifying a collision
+        registers[15] = int(np.any(self.pixels[region] & sprite))
 
-        # Set the pixel unset flag register
-        self.registers[15] = pixel_unset
+        # Set the pixels, XOR to turn off in the case of a collision
+        self.pixels[region] ^= sprite
 
-        # Update the display
-        self.draw_to_display()
+        # Mark the display for an update, but only if the sprite actually flipped any pixels
+        if sprite.any():
+            self.display_dirty = True
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Drawing the sprite with a height of {height} and found at address {self.register_i} to the screen at the x-cooordinate from the value of register {register_x} and y-coordinate from the value of register {register_y} ({register_x_value, register_y_value}).")
+        logger.debug("Execute Opcode %04x: Drawing the sprite with a height of %s and found at address %s to the screen at the x-cooordinate from the value of register %s and y-coordinate from the value of register %s (%s, %s).", opcode, height, self.register_i, register_x, register_y, register_x_value, register_y_value)
 
-    def opcode_if_key_pressed(self, opcode: bytes) -> None:
+    def skip_if_key_state(self, opcode: int, expected: bool) -> None:
         """
-        Skip the next instruction if the key represented by the value of the provided register is pressed.
+        Skip the next instruction if the pressed state of the key represented by the value of the provided register matches the expected state.
         :param opcode: The opcode to execute.
+        :param expected: The pressed state which should cause the skip.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         key = self.registers[register]
-        pressed = self.keys[key]
+        pressed = bool(self.keys[key])
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if the key represented by the value of register {register} ({key}) is pressed ({pressed}).")
+        # Skip the next instruction if the key state matches, advancing branchlessly
+        self.program_counter += OPCODE_SIZE * (pressed == expected)
+        logger.debug("Execute Opcode %04x: Skip next instruction if the key represented by the value of register %s (%s) is %spressed (%s).", opcode, register, key, "" if expected else "not ", pressed)
 
-        # Skip the next instruction if the key is pressed
-        if pressed:
-            self.program_counter += OPCODE_SIZE
-            logger.debug("Instruction skipped.")
-        else:
-            logger.debug("Instruction not skipped.")
+    def opcode_if_key_pressed(self, opcode: int) -> None:
+        """
+        Skip the next instruction if the key represented by the value of the provided register is pressed.
+        :param opcode: The opcode to execute.
+        """
+        self.skip_if_key_state(opcode, True)
 
-    def opcode_if_key_not_pressed(self, opcode: bytes) -> None:
+    def opcode_if_key_not_pressed(self, opcode: int) -> None:
         """
         Skip the next instruction if the key represented by the value of the provided register is not pressed.
         :param opcode: The opcode to execute.
         """
-        # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
-        key = self.registers[register]
-        pressed = self.keys[key]
+        self.skip_if_key_state(opcode, False)
 
-        logger.debug(f"Execute Opcode {opcode.hex()}: Skip next instruction if the key represented by the value of register {register} ({key}) is not pressed ({pressed}).")
-
-        # Skip the next instruction if the key is not pressed
-        if not pressed:
-            self.program_counter += OPCODE_SIZE
-            logger.debug("Instruction skipped.")
-        else:
-            logger.debug("Instruction not skipped.")
-
-    def opcode_get_delay_timer(self, opcode: bytes) -> None:
+    def opcode_get_delay_timer(self, opcode: int) -> None:
         """
         Sets the value of the provided register to the value of the delay timer.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
 
         # Perform the instruction
         self.registers[register] = self.delay
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register {register} to the value of the delay timer ({self.registers[register]}).")
+        logger.debug("Execute Opcode %04x: Set the value of register %s to the value of the delay timer (%s).", opcode, register, self.registers[register])
 
-    def opcode_wait_for_key_press(self, opcode: bytes) -> None:
+    def opcode_wait_for_key_press(self, opcode: int) -> None:
         """
         Block all execution until a keypress is detected, at which point it is stored in the provided register and execution may resume.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
 
         # Perform the instruction
         self.waiting_for_key.is_waiting = True
         self.waiting_for_key.storing_register = register
-        logger.debug(f"Execute Opcode {opcode.hex()}: Blocking operation until a keypress is detected and stored in register {register}.")
+        logger.debug("Execute Opcode %04x: Blocking operation until a keypress is detected and stored in register %s.", opcode, register)
 
-    def opcode_set_delay_timer(self, opcode: bytes) -> None:
+    def opcode_set_delay_timer(self, opcode: int) -> None:
         """
         Sets the delay timer to the value of the provided register.
         :param opcode: The opcode to execute.
         """
-        # Immediately toggle off the timer
-        self.toggle_delay_timer(False)
-
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
 
-        # Perform the instruction
+        # Perform the instruction; the CPU loop handles the ticking
         self.delay = register_value
+        logger.debug("Execute Opcode %04x: Set the value of the delay timer to value of register %s (%s).", opcode, register, register_value)
 
-        # Start the timer if the delay is positive
-        if self.delay > 0:
-            self.toggle_delay_timer(True)
-
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of the delay timer to value of register {register} ({register_value}).")
-
-    def opcode_set_sound_timer(self, opcode: bytes) -> None:
+    def opcode_set_sound_timer(self, opcode: int) -> None:
         """
         Sets the sound timer to the value of the provided register, playing a sound if the value is greater than 0.
         :param opcode: The opcode to execute.
         """
-        # Immediately toggle off the timer
-        self.toggle_sound_timer(False)
-
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
 
-        # Perform the instruction
+        # Perform the instruction, starting the sound only on the transition from silent to playing; the CPU loop handles the ticking
+        previously_playing = self.sound > 0
         self.sound = register_value
+        if self.sound > 0 and not previously_playing:
+            self.sound_channel.unpause()
 
-        # Start the timer and start the sound if the delay is positive
-        if self.sound > 0:
-            self.sound_player.play(-1)
-            self.toggle_sound_timer(True)
-
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of the delay timer to value of register {register} ({register_value}).")
+        logger.debug("Execute Opcode %04x: Set the value of the delay timer to value of register %s (%s).", opcode, register, register_value)
 
-    def opcode_register_i_addition(self, opcode: bytes) -> None:
+    def opcode_register_i_addition(self, opcode: int) -> None:
         """
         Add the value of the provided register to register I.  The overflow flag (register 15) is set.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
         register_i_value = self.register_i
         sum_of_registers = register_i_value + register_value
-        result = sum_of_registers % RAM_SIZE
-        overflow = 1 if sum_of_registers >= RAM_SIZE else 0
+        result = sum_of_registers & ADDRESS_MASK
+        overflow = int(sum_of_registers >= RAM_SIZE)
 
         # Perform the instruction
         self.register_i = result
         self.registers[15] = overflow
-        logger.debug(f"Execute Opcode {opcode.hex()}: Adds the value of register {register} to the value of register I {register} ({register_i_value} + {register_value} = {result}, overflow = {overflow}).")
+        logger.debug("Execute Opcode %04x: Adds the value of register %s to the value of register I %s (%s + %s = %s, overflow = %s).", opcode, register, register, register_i_value, register_value, result, overflow)
 
-    def opcode_set_register_i_to_hex_sprite_address(self, opcode: bytes) -> None:
+    def opcode_set_register_i_to_hex_sprite_address(self, opcode: int) -> None:
         """
         Sets the value of register I to the address of the hexadecimal sprite represented by the value in the provided register.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
 
         # Perform the instruction
         self.register_i = register_value * HEX_CHAR_SPRITE_HEIGHT
-        logger.debug(f"Execute Opcode {opcode.hex()}: Set the value of register I to the address ({self.register_i}) of the hexadecimal sprite represented by the value of register {register} ({register_value}).")
+        logger.debug("Execute Opcode %04x: Set the value of register I to the address (%s) of the hexadecimal sprite represented by the value of register %s (%s).", opcode, self.register_i, register, register_value)
 
-    def opcode_binary_coded_decimal(self, opcode: bytes) -> None:
+    def opcode_binary_coded_decimal(self, opcode: int) -> None:
         """
         Store the Binary Coded Decimal representation of the value of the provided register in memory, starting at the value of register I.
         Hundreds digit stored in memory at the location of the value of register I.
@@ -1110,60 +1143,47 @@ class Emulator:
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        register = self.get_lower_nibble(opcode[0])
+        register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
         register_value = self.registers[register]
-        hundreds = register_value // 100 % 10
-        tens = register_value // 10 % 10
-        units = register_value % 10
+        digits = BCD_TABLE[register_value]
+        hundreds, tens, units = digits
 
-        # Perform the instruction
-        self.ram[self.register_i] = hundreds
-        self.ram[self.register_i + 1] = tens
-        self.ram[self.register_i + 2] = units
-        logger.debug(f"Execute Opcode {opcode.hex()}: Store the Binary Coded Decimal representation of the value of register {register} ({register_value}), starting at the value of register I ({hex(self.register_i)}), ({hundreds} at {hex(self.register_i)}, {tens} at {hex(self.register_i + 1)}, {units} at {hex(self.register_i + 2)}).")
+        # Perform the instruction with a single slice copy
+        self.ram[self.register_i:self.register_i + len(digits)] = digits
+        logger.debug("Execute Opcode %04x: Store the Binary Coded Decimal representation of the value of register %s (%s), starting at the value of register I (%s), (%s at %s, %s at %s, %s at %s).", opcode, register, register_value, hex(self.register_i), hundreds, hex(self.register_i), tens, hex(self.register_i + 1), units, hex(self.register_i + 2))
 
-    def opcode_register_dump(self, opcode: bytes) -> None:
+    def opcode_register_dump(self, opcode: int) -> None:
         """
         Store the values of all registers from register 0 to the provided register in memory, starting at the value of register I.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        last_register = self.get_lower_nibble(opcode[0])
-
-        logger.debug(f"Execute Opcode {opcode.hex()}: Dumping the values of all registers from register 0 to register {last_register} into memory, starting at the value of register I ({hex(self.register_i)}).")
+        last_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        register_count = last_register + 1
 
-        # Go through each register in the provided range
-        for register in range(last_register + 1):
-            # Get the address at which to dump
-            target_address = self.register_i + register
+        # Perform the instruction with a single bulk copy
+        self.ram[self.register_i:self.register_i + register_count] = self.registers[0:register_count]
+        logger.debug("Execute Opcode %04x: Dumping the values of all registers from register 0 to register %s into memory, starting at the value of register I (%s).", opcode, last_register, hex(self.register_i))
 
-            # Dump the value
-            self.ram[target_address] = self.registers[register]
-            logger.debug(
-                f"Register {register}'s value ({self.registers[register]}) stored at address {target_address}.")
-
-    def opcode_register_load(self, opcode: bytes) -> None:
+    def opcode_register_load(self, opcode: int) -> None:
         """
         Load the values of all registers from register 0 to the provided register from memory, starting at the value of register I.
         :param opcode: The opcode to execute.
         """
         # Get the necessary information from the opcode
-        last_register = self.get_lower_nibble(opcode[0])
-
-        logger.debug(f"Execute Opcode {opcode.hex()}: Loading the values of all registers from register 0 to register {last_register} from memory, starting at the value of register I ({hex(self.register_i)}).")
+        last_register = (opcode >> BYTE_SIZE) & LOWER_NIBBLE_MASK
+        register_count = last_register + 1
 
-        # Go through each register in the provided range
-        for register in range(last_register + 1):
-            # Get the address from which to load
-            target_address = self.register_i + register
-
-            # Load the value
-            self.registers[register] = self.ram[target_address]
-            logger.debug(f"Register {register}'s value ({self.registers[register]}) loaded from address {target_address}.")
+        # Perform the instruction with a single bulk copy
+        self.registers[0:register_count] = self.ram[self.register_i:self.register_i + register_count]
+        logger.debug("Execute Opcode %04x: Loading the values of all registers from register 0 to register %s from memory, starting at the value of register I (%s).", opcode, last_register, hex(self.register_i))
     # endregion
 
 
 if __name__ == "__main__":
+    # Set up the logging
+    configure_logging()
+
     # Create an instance
     emulator = Emulator()
 
@@ -52,60 +52,62 @@ class TestIndividualOpcodes:
 
     def test_opcode_return_from_subroutine(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
-        assert len(self.emulator.stack) == 0, "Stack starting out non-empty."
+        assert self.emulator.stack_pointer == 0, "Stack starting out non-empty."
 
-        self.emulator.opcode_return_from_subroutine(bytes.fromhex("00EE"))
+        self.emulator.opcode_return_from_subroutine(int("00EE", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Returning from a subroutine when not in one messed up the program counter."
-        assert len(self.emulator.stack) == 0, "Stack got into a weird state when trying to return from a subroutine when not in one."
+        assert self.emulator.stack_pointer == 0, "Stack got into a weird state when trying to return from a subroutine when not in one."
 
-        self.emulator.stack = [2000, 3000]
-        self.emulator.opcode_return_from_subroutine(bytes.fromhex("00EE"))
+        self.emulator.stack[0] = 2000
+        self.emulator.stack[1] = 3000
+        self.emulator.stack_pointer = 2
+        self.emulator.opcode_return_from_subroutine(int("00EE", HEX_SIZE))
         assert self.emulator.program_counter == 3000, "Program counter set to wrong value when returning from a subroutine."
-        assert len(self.emulator.stack) == 1, "Stack entries incorrect after returning from a subroutine."
+        assert self.emulator.stack_pointer == 1, "Stack entries incorrect after returning from a subroutine."
 
-        self.emulator.opcode_return_from_subroutine(bytes.fromhex("00EE"))
+        self.emulator.opcode_return_from_subroutine(int("00EE", HEX_SIZE))
         assert self.emulator.program_counter == 2000, "Program counter set to wrong value when returning from a subroutine."
-        assert len(self.emulator.stack) == 0, "Stack entries incorrect after returning from a subroutine."
+        assert self.emulator.stack_pointer == 0, "Stack entries incorrect after returning from a subroutine."
 
     def test_opcode_goto(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
 
-        self.emulator.opcode_goto(bytes.fromhex("14e5"))
+        self.emulator.opcode_goto(int("14e5", HEX_SIZE))
         assert self.emulator.program_counter == int("4e5", HEX_SIZE), "Program counter incorrect after jump opcode."
 
     def test_opcode_call_subroutine(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
-        assert len(self.emulator.stack) == 0, "Stack starting out non-empty."
+        assert self.emulator.stack_pointer == 0, "Stack starting out non-empty."
 
-        self.emulator.opcode_call_subroutine(bytes.fromhex("2578"))
+        self.emulator.opcode_call_subroutine(int("2578", HEX_SIZE))
         assert self.emulator.program_counter == int("578", HEX_SIZE), "Program counter incorrect after subroutine call."
-        assert len(self.emulator.stack) == 1 and self.emulator.stack[0] == GAME_START_ADDRESS, "Previous program counter not added to the stack."
+        assert self.emulator.stack_pointer == 1 and self.emulator.stack[0] == GAME_START_ADDRESS, "Previous program counter not added to the stack."
 
-        self.emulator.opcode_call_subroutine(bytes.fromhex("2a23"))
+        self.emulator.opcode_call_subroutine(int("2a23", HEX_SIZE))
         assert self.emulator.program_counter == int("a23", HEX_SIZE), "Program counter incorrect after subroutine call."
-        assert len(self.emulator.stack) == 2 and self.emulator.stack[1] == int("578", HEX_SIZE), "Previous program counter not added to the stack."
-        assert len(self.emulator.stack) == 2 and self.emulator.stack[0] == GAME_START_ADDRESS, "Earlier stack value was modified."
+        assert self.emulator.stack_pointer == 2 and self.emulator.stack[1] == int("578", HEX_SIZE), "Previous program counter not added to the stack."
+        assert self.emulator.stack_pointer == 2 and self.emulator.stack[0] == GAME_START_ADDRESS, "Earlier stack value was modified."
 
     def test_opcode_if_equal(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
         assert self.emulator.registers[6] == 0, "Register starting at an unexpected value."
 
-        self.emulator.opcode_if_equal(bytes.fromhex("3698"))
+        self.emulator.opcode_if_equal(int("3698", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite register value not matching."
 
         self.emulator.registers[6] = int("98", HEX_SIZE)
-        self.emulator.opcode_if_equal(bytes.fromhex("3698"))
+        self.emulator.opcode_if_equal(int("3698", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_if_not_equal(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
 
         self.emulator.registers[6] = int("98", HEX_SIZE)
-        self.emulator.opcode_if_not_equal(bytes.fromhex("3698"))
+        self.emulator.opcode_if_not_equal(int("3698", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite register value matching."
 
         self.emulator.registers[6] = int("ff", HEX_SIZE)
-        self.emulator.opcode_if_not_equal(bytes.fromhex("3698"))
+        self.emulator.opcode_if_not_equal(int("3698", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_if_register_equal(self):
@@ -113,19 +115,19 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[10] = int("11", HEX_SIZE)
         self.emulator.registers[4] = int("12", HEX_SIZE)
-        self.emulator.opcode_if_register_equal(bytes.fromhex("5a40"))
+        self.emulator.opcode_if_register_equal(int("5a40", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite register values matching."
 
         self.emulator.registers[10] = int("40", HEX_SIZE)
         self.emulator.registers[4] = int("40", HEX_SIZE)
-        self.emulator.opcode_if_register_equal(bytes.fromhex("5a40"))
+        self.emulator.opcode_if_register_equal(int("5a40", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_set_register_value(self):
         for register in self.emulator.registers:
             assert register == 0, "Register starting at an unexpected value."
 
-        self.emulator.opcode_set_register_value(bytes.fromhex("6133"))
+        self.emulator.opcode_set_register_value(int("6133", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 1:
                 assert register == int("33", HEX_SIZE), "Register not set to correct value."
@@ -137,14 +139,14 @@ class TestIndividualOpcodes:
             assert register == 0, "Register starting at an unexpected value."
 
         self.emulator.registers[11] = 10
-        self.emulator.opcode_add_value(bytes.fromhex("7b05"))
+        self.emulator.opcode_add_value(int("7b05", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 11:
                 assert register == 15, "Register addition failed."
             else:
                 assert register == 0, "Different register than target had its value modified."
 
-        self.emulator.opcode_add_value(bytes.fromhex("7bfa"))
+        self.emulator.opcode_add_value(int("7bfa", HEX_SIZE))
         assert self.emulator.registers[11] == 9, "Register addition overflow did not work as expected."
         assert self.emulator.registers[15] == 0, "Carry bit was set when it should not be modified by this instruction."
 
@@ -153,7 +155,7 @@ class TestIndividualOpcodes:
             assert register == 0, "Register starting at an unexpected value."
 
         self.emulator.registers[8] = 47
-        self.emulator.opcode_set_register_value_other_register(bytes.fromhex("8480"))
+        self.emulator.opcode_set_register_value_other_register(int("8480", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4 or index == 8:
                 assert register == 47, "Register not set to correct value."
@@ -166,7 +168,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 170
         self.emulator.registers[8] = 85
-        self.emulator.opcode_set_register_bitwise_or(bytes.fromhex("8481"))
+        self.emulator.opcode_set_register_bitwise_or(int("8481", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 255, "Register not set to correct value."
@@ -181,7 +183,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 204
         self.emulator.registers[8] = 170
-        self.emulator.opcode_set_register_bitwise_and(bytes.fromhex("8482"))
+        self.emulator.opcode_set_register_bitwise_and(int("8482", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 136, "Register not set to correct value."
@@ -196,7 +198,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 204
         self.emulator.registers[8] = 170
-        self.emulator.opcode_set_register_bitwise_xor(bytes.fromhex("8483"))
+        self.emulator.opcode_set_register_bitwise_xor(int("8483", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 102, "Register not set to correct value."
@@ -211,7 +213,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 200
         self.emulator.registers[8] = 33
-        self.emulator.opcode_add_other_register(bytes.fromhex("8484"))
+        self.emulator.opcode_add_other_register(int("8484", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 233, "Register not set to correct value."
@@ -222,7 +224,7 @@ class TestIndividualOpcodes:
             else:
                 assert register == 0, "Different register than target had its value modified."
 
-        self.emulator.opcode_add_other_register(bytes.fromhex("8484"))
+        self.emulator.opcode_add_other_register(int("8484", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 10, "Register not set to correct value."
@@ -239,7 +241,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 100
         self.emulator.registers[8] = 70
-        self.emulator.opcode_subtract_from_first_register(bytes.fromhex("8485"))
+        self.emulator.opcode_subtract_from_first_register(int("8485", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 30, "Register not set to correct value."
@@ -250,7 +252,7 @@ class TestIndividualOpcodes:
             else:
                 assert register == 0, "Different register than target had its value modified."
 
-        self.emulator.opcode_subtract_from_first_register(bytes.fromhex("8485"))
+        self.emulator.opcode_subtract_from_first_register(int("8485", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 216, "Register not set to correct value."
@@ -267,7 +269,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 85
         self.emulator.registers[8] = 70
-        self.emulator.opcode_bit_shift_right(bytes.fromhex("8486"))
+        self.emulator.opcode_bit_shift_right(int("8486", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 42, "Register not set to correct value."
@@ -278,7 +280,7 @@ class TestIndividualOpcodes:
             else:
                 assert register == 0, "Different register than target had its value modified."
 
-        self.emulator.opcode_bit_shift_right(bytes.fromhex("8486"))
+        self.emulator.opcode_bit_shift_right(int("8486", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 21, "Register not set to correct value."
@@ -295,7 +297,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 70
         self.emulator.registers[8] = 100
-        self.emulator.opcode_subtract_from_second_register(bytes.fromhex("8487"))
+        self.emulator.opcode_subtract_from_second_register(int("8487", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 30, "Register not set to correct value."
@@ -307,7 +309,7 @@ class TestIndividualOpcodes:
                 assert register == 0, "Different register than target had its value modified."
 
         self.emulator.registers[8] = 10
-        self.emulator.opcode_subtract_from_second_register(bytes.fromhex("8487"))
+        self.emulator.opcode_subtract_from_second_register(int("8487", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 236, "Register not set to correct value."
@@ -324,7 +326,7 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 171
         self.emulator.registers[8] = 70
-        self.emulator.opcode_bit_shift_left(bytes.fromhex("848e"))
+        self.emulator.opcode_bit_shift_left(int("848e", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 86, "Register not set to correct value."
@@ -335,7 +337,7 @@ class TestIndividualOpcodes:
             else:
                 assert register == 0, "Different register than target had its value modified."
 
-        self.emulator.opcode_bit_shift_left(bytes.fromhex("848e"))
+        self.emulator.opcode_bit_shift_left(int("848e", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 4:
                 assert register == 172, "Register not set to correct value."
@@ -351,25 +353,25 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[10] = int("40", HEX_SIZE)
         self.emulator.registers[4] = int("40", HEX_SIZE)
-        self.emulator.opcode_if_register_not_equal(bytes.fromhex("9a40"))
+        self.emulator.opcode_if_register_not_equal(int("9a40", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite register values not matching."
 
         self.emulator.registers[10] = int("11", HEX_SIZE)
         self.emulator.registers[4] = int("12", HEX_SIZE)
-        self.emulator.opcode_if_register_not_equal(bytes.fromhex("9a40"))
+        self.emulator.opcode_if_register_not_equal(int("9a40", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_set_register_i(self):
         assert self.emulator.register_i == 0, "Register I starting at an unexpected value."
 
-        self.emulator.opcode_set_register_i(bytes.fromhex("a491"))
+        self.emulator.opcode_set_register_i(int("a491", HEX_SIZE))
         assert self.emulator.register_i == int("491", HEX_SIZE), "Register I set to the wrong value."
 
     def test_opcode_goto_addition(self):
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter starting at an unexpected value."
 
         self.emulator.registers[0] = 20
-        self.emulator.opcode_goto_addition(bytes.fromhex("b5b2"))
+        self.emulator.opcode_goto_addition(int("b5b2", HEX_SIZE))
         assert self.emulator.program_counter == int("5b2", HEX_SIZE) + 20, "Program counter incorrect after jump opcode."
 
     def test_opcode_if_key_pressed(self):
@@ -377,11 +379,11 @@ class TestIndividualOpcodes:
         assert not self.emulator.keys[6], "Key press starting at an unexpected value."
 
         self.emulator.registers[4] = 6
-        self.emulator.opcode_if_key_pressed(bytes.fromhex("e49e"))
+        self.emulator.opcode_if_key_pressed(int("e49e", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite key not pressed."
 
         self.emulator.keys[6] = True
-        self.emulator.opcode_if_key_pressed(bytes.fromhex("e49e"))
+        self.emulator.opcode_if_key_pressed(int("e49e", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_if_key_not_pressed(self):
@@ -390,11 +392,11 @@ class TestIndividualOpcodes:
 
         self.emulator.registers[4] = 6
         self.emulator.keys[6] = True
-        self.emulator.opcode_if_key_not_pressed(bytes.fromhex("e4a1"))
+        self.emulator.opcode_if_key_not_pressed(int("e4a1", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS, "Program counter was changed despite key pressed."
 
         self.emulator.keys[6] = False
-        self.emulator.opcode_if_key_not_pressed(bytes.fromhex("e4a1"))
+        self.emulator.opcode_if_key_not_pressed(int("e4a1", HEX_SIZE))
         assert self.emulator.program_counter == GAME_START_ADDRESS + OPCODE_SIZE, "Next instruction was not skipped when it should have been."
 
     def test_opcode_get_delay_timer(self):
@@ -403,7 +405,7 @@ class TestIndividualOpcodes:
             assert register == 0, "Register starting at an unexpected value."
 
         self.emulator.delay = 55
-        self.emulator.opcode_get_delay_timer(bytes.fromhex("f307"))
+        self.emulator.opcode_get_delay_timer(int("f307", HEX_SIZE))
         for index, register in enumerate(self.emulator.registers):
             if index == 3:
                 assert register == 55, "Register not set to correct value."
@@ -414,25 +416,25 @@ class TestIndividualOpcodes:
         assert self.emulator.delay == 0, "Delay timer starting at an unexpected value."
 
         self.emulator.registers[3] = 44
-        self.emulator.opcode_set_delay_timer(bytes.fromhex("f315"))
+        self.emulator.opcode_set_delay_timer(int("f315", HEX_SIZE))
         assert self.emulator.delay == 44, "Delay timer was not set correctly."
 
     def test_opcode_set_sound_timer(self):
         assert self.emulator.sound == 0, "Sound timer starting at an unexpected value."
 
         self.emulator.registers[3] = 44
-        self.emulator.opcode_set_sound_timer(bytes.fromhex("f318"))
+        self.emulator.opcode_set_sound_timer(int("f318", HEX_SIZE))
         assert self.emulator.sound == 44, "Sound timer was not set correctly."
 
     def test_opcode_register_i_addition(self):
         self.emulator.register_i = 4050
         self.emulator.registers[7] = 50
-        self.emulator.opcode_register_i_addition(bytes.fromhex("f71e"))
+        self.emulator.opcode_register_i_addition(int("f71e", HEX_SIZE))
         assert self.emulator.register_i == 4, "Register I set to the wrong value."
         assert self.emulator.registers[7] == 50, "Value of register was changed when it was not the target of the addition."
         assert self.emulator.registers[15] == 1, "Overflow flag was not set correctly."
 
-        self.emulator.opcode_register_i_addition(bytes.fromhex("f71e"))
+        self.emulator.opcode_register_i_addition(int("f71e", HEX_SIZE))
         assert self.emulator.register_i == 54, "Register I set to the wrong value."
         assert self.emulator.registers[7] == 50, "Value of register was changed when it was not the target of the addition."
         assert self.emulator.registers[15] == 0, "Overflow flag was not set correctly."
@@ -442,7 +444,7 @@ class TestIndividualOpcodes:
 
         self.emulator.load_digit_sprites()
         self.emulator.registers[4] = 11
-        self.emulator.opcode_set_register_i_to_hex_sprite_address(bytes.fromhex("f429"))
+        self.emulator.opcode_set_register_i_to_hex_sprite_address(int("f429", HEX_SIZE))
         assert self.emulator.register_i == 55, "Register I was not set to the correct address for the given sprite."
         assert self.emulator.ram[self.emulator.register_i] == int("e0", HEX_SIZE), "The first byte of the B sprite is incorrect."
         assert self.emulator.ram[self.emulator.register_i + 1] == int("90", HEX_SIZE), "The second byte of the B sprite is incorrect."
@@ -457,7 +459,7 @@ class TestIndividualOpcodes:
 
         self.emulator.register_i = 3123
         self.emulator.registers[12] = 135
-        self.emulator.opcode_binary_coded_decimal(bytes.fromhex("fc33"))
+        self.emulator.opcode_binary_coded_decimal(int("fc33", HEX_SIZE))
         assert self.emulator.register_i == 3123, "Register I was modified when it should be left untouched."
         for index, byte in enumerate(self.emulator.ram):
             if index == 3123:
@@ -470,7 +472,7 @@ class TestIndividualOpcodes:
                 assert byte == 0, "Non-targeted ram address was changed when it shouldn't have been."
 
         self.emulator.registers[12] = 68
-        self.emulator.opcode_binary_coded_decimal(bytes.fromhex("fc33"))
+        self.emulator.opcode_binary_coded_decimal(int("fc33", HEX_SIZE))
         assert self.emulator.register_i == 3123, "Register I was modified when it should be left untouched."
         for index, byte in enumerate(self.emulator.ram):
             if index == 3123:
@@ -483,7 +485,7 @@ class TestIndividualOpcodes:
                 assert byte == 0, "Non-targeted ram address was changed when it shouldn't have been."
 
         self.emulator.registers[12] = 5
-        self.emulator.opcode_binary_coded_decimal(bytes.fromhex("fc33"))
+        self.emulator.opcode_binary_coded_decimal(int("fc33", HEX_SIZE))
         assert self.emulator.register_i == 3123, "Register I was modified when it should be left untouched."
         for index, byte in enumerate(self.emulator.ram):
             if index == 3123:
@@ -506,7 +508,7 @@ class TestIndividualOpcodes:
         self.emulator.register_i = 2000
         for register in range(last_register + 1):
             self.emulator.registers[register] = (register + 1) * 10
-        self.emulator.opcode_register_dump(bytes.fromhex("fc55"))
+        self.emulator.opcode_register_dump(int("fc55", HEX_SIZE))
         assert self.emulator.register_i == 2000, "Register I was modified when it should be left untouched."
         for index, register in enumerate(self.emulator.registers):
             if index < last_register + 1:
@@ -530,7 +532,7 @@ class TestIndividualOpcodes:
         self.emulator.register_i = 2000
         for byte in range(last_register + 1):
             self.emulator.ram[self.emulator.register_i + byte] = (byte + 1) * 10
-        self.emulator.opcode_register_load(bytes.fromhex("fc65"))
+        self.emulator.opcode_register_load(int("fc65", HEX_SIZE))
         assert self.emulator.register_i == 2000, "Register I was modified when it should be left untouched."
         for index, register in enumerate(self.emulator.registers):
             if index < last_register + 1:
@@ -558,216 +560,216 @@ class TestOpcodeRouting:
 
     @mock.patch.object(Emulator, "opcode_call_subroutine")
     def test_call_machine_code_routine(self, mock_method):
-        opcode = bytes.fromhex("0d52")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("0d52", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_clear_screen")
     def test_clear_screen(self, mock_method):
-        opcode = bytes.fromhex("00e0")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("00e0", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_return_from_subroutine")
     def test_return_from_subroutine(self, mock_method):
-        opcode = bytes.fromhex("00ee")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("00ee", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_goto")
     def test_goto(self, mock_method):
-        opcode = bytes.fromhex("132a")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("132a", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_call_subroutine")
     def test_call_subroutine(self, mock_method):
-        opcode = bytes.fromhex("232a")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("232a", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_equal")
     def test_if_equal(self, mock_method):
-        opcode = bytes.fromhex("332a")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("332a", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_not_equal")
     def test_if_not_equal(self, mock_method):
-        opcode = bytes.fromhex("432a")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("432a", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_register_equal")
     def test_if_register_equal(self, mock_method):
-        opcode = bytes.fromhex("5320")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("5320", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_value")
     def test_set_register_value(self, mock_method):
-        opcode = bytes.fromhex("6133")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("6133", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_add_value")
     def test_add_value(self, mock_method):
-        opcode = bytes.fromhex("7433")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("7433", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_return_from_subroutine")
     def test_return_from_subroutine(self, mock_method):
-        opcode = bytes.fromhex("00EE")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("00EE", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_value_other_register")
     def test_set_register_value_other_register(self, mock_method):
-        opcode = bytes.fromhex("8480")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8480", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_bitwise_or")
     def test_set_register_bitwise_or(self, mock_method):
-        opcode = bytes.fromhex("8481")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8481", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_bitwise_and")
     def test_set_register_bitwise_and(self, mock_method):
-        opcode = bytes.fromhex("8482")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8482", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_bitwise_xor")
     def test_set_register_bitwise_xor(self, mock_method):
-        opcode = bytes.fromhex("8483")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8483", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_add_other_register")
     def test_add_other_register(self, mock_method):
-        opcode = bytes.fromhex("8484")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8484", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_subtract_from_first_register")
     def test_subtract_from_first_register(self, mock_method):
-        opcode = bytes.fromhex("8485")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8485", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_bit_shift_right")
     def test_bit_shift_right(self, mock_method):
-        opcode = bytes.fromhex("8486")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8486", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_subtract_from_second_register")
     def test_subtract_from_second_register(self, mock_method):
-        opcode = bytes.fromhex("8487")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("8487", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_bit_shift_left")
     def test_bit_shift_left(self, mock_method):
-        opcode = bytes.fromhex("848e")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("848e", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_register_not_equal")
     def test_if_register_not_equal(self, mock_method):
-        opcode = bytes.fromhex("9320")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("9320", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_i")
     def test_set_register_i(self, mock_method):
-        opcode = bytes.fromhex("a841")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("a841", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_goto_addition")
     def test_goto_addition(self, mock_method):
-        opcode = bytes.fromhex("b5b2")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("b5b2", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_random_bitwise_and")
     def test_random_bitwise_and(self, mock_method):
-        opcode = bytes.fromhex("c499")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("c499", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_draw_sprite")
     def test_draw_sprite(self, mock_method):
-        opcode = bytes.fromhex("d458")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("d458", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_key_pressed")
     def test_if_key_pressed(self, mock_method):
-        opcode = bytes.fromhex("e49e")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("e49e", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_if_key_not_pressed")
     def test_if_key_not_pressed(self, mock_method):
-        opcode = bytes.fromhex("e4a1")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("e4a1", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_get_delay_timer")
     def test_get_delay_timer(self, mock_method):
-        opcode = bytes.fromhex("f307")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f307", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_wait_for_key_press")
     def test_wait_for_key_press(self, mock_method):
-        opcode = bytes.fromhex("f90a")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f90a", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_delay_timer")
     def test_set_delay_timer(self, mock_method):
-        opcode = bytes.fromhex("f315")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f315", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_sound_timer")
     def test_set_sound_timer(self, mock_method):
-        opcode = bytes.fromhex("f318")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f318", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_register_i_addition")
     def test_register_i_addition(self, mock_method):
-        opcode = bytes.fromhex("f71e")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f71e", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_set_register_i_to_hex_sprite_address")
     def test_set_register_i_to_hex_sprite_address(self, mock_method):
-        opcode = bytes.fromhex("f029")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("f029", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_binary_coded_decimal")
     def test_binary_coded_decimal(self, mock_method):
-        opcode = bytes.fromhex("fc33")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("fc33", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_register_dump")
     def test_register_dump(self, mock_method):
-        opcode = bytes.fromhex("fc55")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("fc55", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)
 
     @mock.patch.object(Emulator, "opcode_register_load")
     def test_register_load(self, mock_method):
-        opcode = bytes.fromhex("fc65")
-        bad_opcode = bytes.fromhex("f000")
+        opcode = int("fc65", HEX_SIZE)
+        bad_opcode = int("f000", HEX_SIZE)
         self.run_opcode(opcode, bad_opcode, mock_method)